@@ -0,0 +1,409 @@
+"""
+모터 계산 구현 간 차분 일관성 검증 하네스
+
+같은 크레인 조건을 네 가지 구현(size_hoist_motor, claude_code.py 파이프라인,
+MarineMotorCalculator, 수작업 함수)에 넣고, 결과가 어디서 얼마나 다른지
+수백만 건 규모로 비교합니다.
+
+입력 매핑 (각 파일의 main() 사용 방식을 따름):
+- size_hoist_motor: 드럼 직경, 줄수, 모터 rpm 그대로, 효율 = reeving_eff (나머지는 기본값)
+- claude_code: 드럼 직경, 줄수 없음, 모터 1750 rpm 고정, 내장 안전율/효율 (효율 입력 없음)
+- MarineMotorCalculator: 반지름 = 직경/2, 운전 속도 = 모터 rpm, 연안/DNV, 추가 안전율 1.2
+- manual: 반지름 = 직경/2, 모터 rpm, 안전율 1.2
+- manual_main: manual 과 같지만 main() 처럼 직경 값을 반지름 자리에 넣음
+
+주요 기능:
+- 무작위 등가 입력 생성 및 구현별 벡터화 계산
+- 기준 구현 대비 비율/상대오차 누적 통계 (줄수별 분포, 최악 입력)
+- 고속 구현(fast path)을 원본 스칼라 구현과 대량 비교하는 검증 함수
+
+Author: Marine Engineering Team
+Date: 2025.08.22
+"""
+
+import inspect
+import io
+import math
+import logging
+import numpy as np
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+import claude_code
+import motor_selection_manual_code as manual
+from claude_code2 import (
+    ClassificationSociety,
+    MarineEnvironment,
+    MarineMotorCalculator,
+    MotorSpecification,
+)
+from gpt_code import size_hoist_motor
+
+logger = logging.getLogger(__name__)
+
+Cases = Dict[str, np.ndarray]
+Outputs = Dict[str, np.ndarray]
+
+QUANTITIES = ("drum_torque_nm", "motor_power_kw", "gear_ratio")
+G = 9.81
+
+# MarineMotorCalculator 매핑 고정값
+MARINE_ENVIRONMENT = MarineEnvironment.COASTAL
+MARINE_CLASSIFICATION = ClassificationSociety.DNV
+MARINE_SAFETY_FACTOR = 1.2
+MARINE_LOAD_INERTIA = 4250
+MARINE_MOTOR_INERTIA = 125
+
+# 수작업 함수 매핑 고정값 (main() 예제)
+MANUAL_SAFETY_FACTOR = 1.2
+
+# size_hoist_motor 기본 인자 (원본 시그니처에서 읽어 벡터화 구현과 어긋나지 않도록 함)
+HOIST_DEFAULTS = {
+    name: p.default for name, p in inspect.signature(size_hoist_motor).parameters.items()
+    if p.default is not inspect.Parameter.empty
+}
+
+
+def generate_cases(n_cases: int, rng: np.random.Generator) -> Cases:
+    """
+    무작위 크레인 조건 생성
+
+    Args:
+        n_cases: 생성 개수
+        rng: 난수 생성기
+
+    Returns:
+        Cases: 입력 이름 → 배열
+    """
+    return {
+        "load_ton": rng.uniform(1.0, 100.0, n_cases),
+        "speed_m_per_min": rng.uniform(2.0, 30.0, n_cases),
+        "drum_diameter_m": rng.uniform(0.3, 2.5, n_cases),
+        "reeving": rng.integers(1, 9, n_cases),
+        "efficiency": rng.uniform(0.75, 0.98, n_cases),
+        "motor_rpm": rng.choice([1450.0, 1750.0, 2900.0], n_cases),
+    }
+
+
+# ---------------------------------------------------------------------------
+# 구현별 벡터화 계산
+# ---------------------------------------------------------------------------
+
+def hoist_vectorized(c: Cases) -> Outputs:
+    """size_hoist_motor 벡터화 (효율 = reeving_eff, 나머지는 기본 인자)"""
+    d = HOIST_DEFAULTS
+    m = c["load_ton"] * 1000.0
+    v_hook = c["speed_m_per_min"] / 60.0
+    r_eff = c["drum_diameter_m"] * d["radius_layer_factor"] / 2.0
+    a = v_hook / d["t_acc"] if d["t_acc"] and d["t_acc"] > 0 else 0
+    f_hook = m * (G + a) * d["dyn_coeff"]
+    t_drum = f_hook / (c["reeving"] * c["efficiency"]) * r_eff
+    omega_drum = c["reeving"] * v_hook / r_eff
+    p_motor_kw = t_drum * omega_drum / (d["gearbox_eff"] * d["bearing_eff"]) * d["service_factor"] / 1000.0
+    omega_motor = 2 * math.pi * c["motor_rpm"] / 60.0
+    return {"drum_torque_nm": t_drum, "motor_power_kw": p_motor_kw, "gear_ratio": omega_motor / omega_drum}
+
+
+def claude_pipeline_vectorized(c: Cases) -> Outputs:
+    """claude_code.py 파이프라인 벡터화 (줄수 없음, 1750 rpm 고정, 효율은 내장값 사용)"""
+    load_n = c["load_ton"] * 1000 * G
+    v = c["speed_m_per_min"] / 60
+    d = c["drum_diameter_m"]
+    required_torque = load_n * d / 2 * 2.0 * 1.3 * 1.2 / 0.95
+    drum_omega = 2 * v / d
+    power_kw = required_torque * drum_omega / (0.95 * 0.98) / 1000
+    motor_omega = 2 * math.pi * 1750 / 60
+    return {"drum_torque_nm": required_torque, "motor_power_kw": power_kw, "gear_ratio": motor_omega / drum_omega}
+
+
+def marine_vectorized(c: Cases) -> Outputs:
+    """MarineMotorCalculator 종합 계산 벡터화 (감속비는 관성 기준이라 비교 제외)"""
+    corrections = MarineMotorCalculator.ENVIRONMENTAL_CORRECTIONS[MARINE_ENVIRONMENT]
+    env_total = corrections["salt"] * corrections["temp"] * corrections["vibration"]
+    class_safety = MarineMotorCalculator.SAFETY_FACTORS.get(MARINE_CLASSIFICATION, 2.0)
+
+    force_n = c["load_ton"] * 1000 * MarineMotorCalculator.GRAVITY_ACCELERATION
+    basic = force_n * (c["drum_diameter_m"] / 2) / c["efficiency"]
+    torque = basic * env_total * class_safety * MARINE_SAFETY_FACTOR
+    power_kw = torque * c["motor_rpm"] * MarineMotorCalculator.RPM_TO_RADIAN_PER_SEC / MarineMotorCalculator.WATT_TO_KILOWATT
+    return {"drum_torque_nm": torque, "motor_power_kw": power_kw, "gear_ratio": np.full_like(torque, np.nan)}
+
+
+def _manual_vectorized(c: Cases, radius: np.ndarray) -> Outputs:
+    torque = c["load_ton"] * 1000 * 9.81 * radius / c["efficiency"] * MANUAL_SAFETY_FACTOR
+    power_kw = torque * c["motor_rpm"] * 2 * math.pi / 60 / 1000
+    return {"drum_torque_nm": torque, "motor_power_kw": power_kw, "gear_ratio": np.full_like(torque, np.nan)}
+
+
+def manual_vectorized(c: Cases) -> Outputs:
+    """수작업 함수 벡터화 (반지름 = 직경/2)"""
+    return _manual_vectorized(c, c["drum_diameter_m"] / 2)
+
+
+def manual_main_vectorized(c: Cases) -> Outputs:
+    """수작업 함수 벡터화 (main() 처럼 직경을 반지름 자리에 입력)"""
+    return _manual_vectorized(c, c["drum_diameter_m"])
+
+
+# ---------------------------------------------------------------------------
+# 원본 스칼라 구현 호출 (기준값)
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def _quiet() -> Iterator[None]:
+    """원본 함수의 print / INFO 로그 억제"""
+    logging.disable(logging.INFO)
+    try:
+        with redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def hoist_scalar(case: Dict[str, float]) -> Dict[str, float]:
+    """size_hoist_motor 원본 호출 (효율 = reeving_eff)"""
+    r = size_hoist_motor(case["load_ton"], case["speed_m_per_min"], drum_diameter_m=case["drum_diameter_m"],
+                         reeving=int(case["reeving"]), reeving_eff=case["efficiency"], motor_rpm=case["motor_rpm"])
+    return {"drum_torque_nm": r["drum_torque_Nm"], "motor_power_kw": r["motor_power_kw"], "gear_ratio": r["gear_ratio"]}
+
+
+def claude_pipeline_scalar(case: Dict[str, float]) -> Dict[str, float]:
+    """claude_code.py 원본 호출 (표준 출력 범위 500 kW 초과 시 출력은 NaN)"""
+    with _quiet():
+        specs = claude_code.calculate_hoist_motor_specifications(
+            case["load_ton"], case["speed_m_per_min"], case["drum_diameter_m"])
+        torque = claude_code.calculate_required_torque(specs)
+        try:
+            power_kw, selected_kw = claude_code.calculate_motor_power(specs, torque)
+        except StopIteration:
+            power_kw, selected_kw = math.nan, None
+        gear_ratio = claude_code.calculate_gear_ratio(specs, selected_kw)
+    return {"drum_torque_nm": torque, "motor_power_kw": power_kw, "gear_ratio": gear_ratio}
+
+
+def marine_scalar(case: Dict[str, float]) -> Dict[str, float]:
+    """MarineMotorCalculator 원본 호출"""
+    spec = MotorSpecification(
+        load_capacity_ton=case["load_ton"], operating_speed_rpm=case["motor_rpm"],
+        drum_radius_m=case["drum_diameter_m"] / 2, system_efficiency=case["efficiency"],
+        safety_factor=MARINE_SAFETY_FACTOR, load_inertia_kgm2=MARINE_LOAD_INERTIA,
+        motor_inertia_kgm2=MARINE_MOTOR_INERTIA, environment=MARINE_ENVIRONMENT,
+        classification=MARINE_CLASSIFICATION
+    )
+    with _quiet():
+        result = MarineMotorCalculator(spec).perform_comprehensive_calculation()
+    return {"drum_torque_nm": result.required_torque_nm, "motor_power_kw": result.motor_power_kw, "gear_ratio": math.nan}
+
+
+def _manual_scalar(case: Dict[str, float], radius: float) -> Dict[str, float]:
+    torque = manual.calculate_torque_kg(case["load_ton"] * 1000, radius, case["efficiency"]) * MANUAL_SAFETY_FACTOR
+    return {"drum_torque_nm": torque, "motor_power_kw": manual.calculate_power(torque, case["motor_rpm"]),
+            "gear_ratio": math.nan}
+
+
+def manual_scalar(case: Dict[str, float]) -> Dict[str, float]:
+    """수작업 함수 원본 호출 (반지름 = 직경/2)"""
+    return _manual_scalar(case, case["drum_diameter_m"] / 2)
+
+
+def manual_main_scalar(case: Dict[str, float]) -> Dict[str, float]:
+    """수작업 함수 원본 호출 (직경을 반지름 자리에 입력)"""
+    return _manual_scalar(case, case["drum_diameter_m"])
+
+
+# 구현 이름 → (벡터화 계산, 원본 스칼라 계산)
+IMPLEMENTATIONS: Dict[str, Tuple[Callable[[Cases], Outputs], Callable[[Dict[str, float]], Dict[str, float]]]] = {
+    "size_hoist_motor": (hoist_vectorized, hoist_scalar),
+    "claude_code": (claude_pipeline_vectorized, claude_pipeline_scalar),
+    "MarineMotorCalculator": (marine_vectorized, marine_scalar),
+    "manual": (manual_vectorized, manual_scalar),
+    "manual_main": (manual_main_vectorized, manual_main_scalar),
+}
+
+
+def scalar_reference(func: Callable[[Dict[str, float]], Dict[str, float]]) -> Callable[[Cases], Outputs]:
+    """원본 스칼라 함수를 배열 입력/출력 형태로 감싸기 (건별 반복)"""
+    def run(c: Cases) -> Outputs:
+        n = len(next(iter(c.values())))
+        rows = [func({k: v[i].item() for k, v in c.items()}) for i in range(n)]
+        return {q: np.array([row[q] for row in rows], dtype=float) for q in QUANTITIES}
+    return run
+
+
+# ---------------------------------------------------------------------------
+# 누적 통계
+# ---------------------------------------------------------------------------
+
+@dataclass
+class DiffStats:
+    """기준 구현 대비 차이 누적 통계"""
+    count: int = 0
+    skipped: int = 0
+    exceed_count: int = 0
+    max_rel_error: float = 0.0
+    worst_case: Optional[Dict[str, float]] = None
+    ratio_min: float = math.inf
+    ratio_max: float = -math.inf
+    log_ratio_sum: float = 0.0
+    ratio_by_reeving: Dict[int, Tuple[float, float]] = field(default_factory=dict)
+
+    @property
+    def ratio_geomean(self) -> float:
+        """비율(구현/기준)의 기하평균"""
+        return math.exp(self.log_ratio_sum / self.count) if self.count else math.nan
+
+    def update(self, cases: Cases, value: np.ndarray, reference: np.ndarray, rtol: float) -> None:
+        """묶음 하나의 결과 반영"""
+        valid = np.isfinite(value) & np.isfinite(reference) & (reference != 0)
+        self.skipped += int((~valid).sum())
+        if not valid.any():
+            return
+
+        ratio = value[valid] / reference[valid]
+        rel_error = np.abs(ratio - 1)
+        self.count += int(valid.sum())
+        self.exceed_count += int((rel_error > rtol).sum())
+        self.ratio_min = min(self.ratio_min, float(ratio.min()))
+        self.ratio_max = max(self.ratio_max, float(ratio.max()))
+        with np.errstate(divide="ignore"):
+            self.log_ratio_sum += float(np.log(np.abs(ratio)).sum())
+
+        worst = int(rel_error.argmax())
+        if rel_error[worst] > self.max_rel_error or self.worst_case is None:
+            self.max_rel_error = float(rel_error[worst])
+            self.worst_case = {k: v[valid][worst].item() for k, v in cases.items()}
+
+        reeving = cases["reeving"][valid]
+        for n in np.unique(reeving):
+            group = ratio[reeving == n]
+            lo, hi = self.ratio_by_reeving.get(int(n), (math.inf, -math.inf))
+            self.ratio_by_reeving[int(n)] = (min(lo, float(group.min())), max(hi, float(group.max())))
+
+
+def run_differential(n_cases: int = 1_000_000,
+                     chunk_size: int = 250_000,
+                     baseline: str = "size_hoist_motor",
+                     rtol: float = 0.01,
+                     seed: Optional[int] = None) -> Dict[Tuple[str, str], DiffStats]:
+    """
+    모든 구현을 기준 구현과 대량 비교
+
+    Args:
+        n_cases: 비교 입력 개수
+        chunk_size: 메모리 제한용 묶음 크기
+        baseline: 기준 구현 이름
+        rtol: 허용 상대오차 (초과 건수 집계용)
+        seed: 난수 시드
+
+    Returns:
+        Dict[Tuple[str, str], DiffStats]: (구현, 물리량) → 통계
+    """
+    if baseline not in IMPLEMENTATIONS:
+        raise ValueError(f"알 수 없는 구현입니다: {baseline}")
+
+    rng = np.random.default_rng(seed)
+    stats = {(name, q): DiffStats() for name in IMPLEMENTATIONS if name != baseline for q in QUANTITIES}
+
+    for start in range(0, n_cases, chunk_size):
+        cases = generate_cases(min(chunk_size, n_cases - start), rng)
+        reference = IMPLEMENTATIONS[baseline][0](cases)
+        for name, (vectorized, _) in IMPLEMENTATIONS.items():
+            if name == baseline:
+                continue
+            outputs = vectorized(cases)
+            for q in QUANTITIES:
+                stats[(name, q)].update(cases, outputs[q], reference[q], rtol)
+
+    logger.info(f"차분 비교 완료: {n_cases:,}건, 기준 {baseline}")
+    return stats
+
+
+def verify_fast_path(candidate: Callable[[Cases], Outputs],
+                     reference: Callable[[Cases], Outputs],
+                     n_cases: int = 1_000_000,
+                     chunk_size: int = 250_000,
+                     rtol: float = 1e-9,
+                     seed: Optional[int] = None) -> Dict[str, DiffStats]:
+    """
+    고속 구현을 기준 구현과 대량 비교 (운영 적용 전 검증)
+
+    Args:
+        candidate: 검증할 고속 구현 (배열 입력/출력)
+        reference: 기준 구현 (원본은 scalar_reference 로 감싸서 전달)
+        n_cases: 비교 입력 개수
+        chunk_size: 묶음 크기
+        rtol: 허용 상대오차
+        seed: 난수 시드
+
+    Returns:
+        Dict[str, DiffStats]: 물리량 → 통계 (exceed_count == 0 이면 통과)
+    """
+    rng = np.random.default_rng(seed)
+    stats = {q: DiffStats() for q in QUANTITIES}
+    reference_finite = {q: 0 for q in QUANTITIES}
+    for start in range(0, n_cases, chunk_size):
+        cases = generate_cases(min(chunk_size, n_cases - start), rng)
+        fast, ref = candidate(cases), reference(cases)
+        for q in QUANTITIES:
+            # 기준값이 NaN/inf 이면 비교 제외 (원본이 정의하지 않는 범위), 고속 구현만 NaN/inf 이면 불일치
+            mismatch = ~np.isfinite(fast[q]) & np.isfinite(ref[q])
+            stats[q].exceed_count += int(mismatch.sum())
+            stats[q].update(cases, fast[q], ref[q], rtol)
+            reference_finite[q] += int(np.isfinite(ref[q]).sum())
+
+    # 기준값은 있는데 비교된 건이 하나도 없으면 검증된 것이 아니므로 실패 처리
+    for q, s in stats.items():
+        if s.count == 0 and reference_finite[q] > 0:
+            s.exceed_count = max(s.exceed_count, reference_finite[q])
+
+    failed = [q for q, s in stats.items() if s.exceed_count]
+    if failed:
+        logger.error(f"고속 구현 검증 실패: {failed}")
+    else:
+        logger.info(f"고속 구현 검증 통과: {n_cases:,}건, 허용 상대오차 {rtol}")
+    return stats
+
+
+def format_report(stats: Dict[Tuple[str, str], DiffStats], baseline: str = "size_hoist_motor") -> str:
+    """
+    차분 비교 보고서 생성
+
+    Args:
+        stats: run_differential 결과
+        baseline: 기준 구현 이름
+
+    Returns:
+        str: 보고서 문자열
+    """
+    report = f"\n{'='*80}\n구현 간 차분 비교 (기준: {baseline}, 비율 = 구현 / 기준)\n{'='*80}\n"
+    for (name, q), s in stats.items():
+        if not s.count:
+            report += f"\n{name} / {q}: 비교 불가 (정의되지 않음, {s.skipped:,}건)\n"
+            continue
+        report += (f"\n{name} / {q}:\n"
+                   f"   비율 범위: {s.ratio_min:.4g} ~ {s.ratio_max:.4g} (기하평균 {s.ratio_geomean:.4g})\n"
+                   f"   최대 상대오차: {s.max_rel_error:.4g}, 허용 초과 {s.exceed_count:,}/{s.count:,}건\n")
+        by_reeving = ", ".join(f"{n}줄 {lo:.3g}~{hi:.3g}" for n, (lo, hi) in sorted(s.ratio_by_reeving.items()))
+        report += f"   줄수별 비율: {by_reeving}\n"
+        worst = ", ".join(f"{k}={v:.4g}" for k, v in s.worst_case.items())
+        report += f"   최악 입력: {worst}\n"
+    return report
+
+
+def main():
+    """메인 실행 함수 - 구현 간 차분 비교 + 벡터화 구현 검증"""
+
+    print("🔍 벡터화 구현 ↔ 원본 스칼라 구현 검증 (각 2,000건)")
+    for name, (vectorized, scalar) in IMPLEMENTATIONS.items():
+        result = verify_fast_path(vectorized, scalar_reference(scalar), n_cases=2_000, chunk_size=2_000, seed=1)
+        worst = max(s.max_rel_error for s in result.values())
+        passed = all(s.exceed_count == 0 for s in result.values())
+        print(f"   {name}: {'통과' if passed else '실패'} (최대 상대오차 {worst:.2e})")
+
+    stats = run_differential(n_cases=2_000_000, seed=0)
+    print(format_report(stats))
+
+
+if __name__ == "__main__":
+    main()
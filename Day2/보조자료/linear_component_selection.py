@@ -0,0 +1,397 @@
+"""
+볼스크류 / LM가이드 / 베어링 벡터화 선정
+
+Day1 선정 시트(LM_가이드_스크류_선정.xlsx, 베어링선정.xlsx)의 계산식을
+calculate_rms_torque 와 같은 운전 패턴(시간/하중 배열) 입력으로 옮긴 모듈입니다.
+여러 축 x 카탈로그 전체를 배열 연산으로 한 번에 평가합니다.
+
+주요 기능:
+- 운전 패턴 기반 등가하중 (3승 평균, 회전수 가중)
+- L10 수명, 볼스크류 좌굴 하중 / 위험 속도 / 구동 RMS 토크
+- 베어링 X·Y 계수, 환경계수, 목표 수명 판정
+- 축별 적합 부품 순위 (정격하중 여유가 가장 작은 모델 우선)
+
+Author: Marine Engineering Team
+Date: 2025.08.22
+"""
+
+import math
+import logging
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STEEL_ELASTIC_MODULUS = 206000       # N/mm²
+STEEL_DENSITY = 7.85e-6              # kg/mm³
+
+# 볼스크류 지지 방식별 계수 (고정-자유, 고정-지지, 고정-고정)
+BUCKLING_COEFFICIENTS = {"고정-자유": 0.25, "고정-지지": 2.0, "고정-고정": 4.0}
+CRITICAL_SPEED_COEFFICIENTS = {"고정-자유": 1.875, "고정-지지": 3.927, "고정-고정": 4.730}
+
+# 베어링 타입별 수명 지수 및 X·Y 계수 기준 (Fa/Fr 한계, X, Y)
+LIFE_EXPONENTS = {"볼베어링": 3.0, "롤러베어링": 10 / 3, "슬루잉베어링": 10 / 3}
+XY_FACTORS = {
+    "볼베어링": (0.25, 0.56, 1.63),
+    "롤러베어링": (0.2, 0.67, 0.5),
+    "슬루잉베어링": (0.2, 0.67, 0.5),
+}
+
+
+@dataclass
+class LMGuideCatalog:
+    """LM가이드 카탈로그"""
+    models: List[str]
+    dynamic_load_n: np.ndarray
+
+
+@dataclass
+class BallScrewCatalog:
+    """볼스크류 카탈로그"""
+    models: List[str]
+    dynamic_load_n: np.ndarray
+    shaft_diameter_mm: np.ndarray
+    lead_mm: np.ndarray
+
+
+@dataclass
+class BearingCatalog:
+    """베어링 카탈로그"""
+    brands: List[str]
+    models: List[str]
+    types: List[str]
+    dynamic_load_n: np.ndarray
+    rated_rpm: np.ndarray
+
+
+@dataclass
+class SelectionResult:
+    """선정 결과 데이터 클래스 (배열 형상: 축 x 부품)"""
+    models: List[str]
+    life_h: np.ndarray
+    feasible: np.ndarray
+    ranking: np.ndarray
+    details: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def ranked_models(self, axis: int) -> List[str]:
+        """축 하나의 적합 모델 (순위순)"""
+        return [self.models[i] for i in self.ranking[axis] if self.feasible[axis, i]]
+
+    @property
+    def best_models(self) -> List[Optional[str]]:
+        """축별 추천 모델 (적합 모델이 없으면 None)"""
+        best = self.ranking[:, 0]
+        return [self.models[i] if self.feasible[axis, i] else None for axis, i in enumerate(best)]
+
+
+# Day1 시트 예시 카탈로그 (실제값 교체 필요)
+THK_LM_GUIDES = LMGuideCatalog(
+    models=["HSR15A", "HSR20A", "HSR25A"],
+    dynamic_load_n=np.array([9800, 12900, 20500], dtype=float),
+)
+
+THK_BALL_SCREWS = BallScrewCatalog(
+    models=["BNT1605", "BNT2005", "BNT2505"],
+    dynamic_load_n=np.array([14700, 24000, 39000], dtype=float),
+    shaft_diameter_mm=np.array([16, 20, 25], dtype=float),
+    lead_mm=np.array([5, 5, 5], dtype=float),
+)
+
+EXAMPLE_BEARINGS = BearingCatalog(
+    brands=["SKF", "NSK", "Timken", "SKF", "NSK"],
+    models=["6208-2RS", "NU208", "HM804846/HM804810", "6310-2RS", "6206DDU"],
+    types=["볼베어링", "롤러베어링", "롤러베어링", "볼베어링", "볼베어링"],
+    dynamic_load_n=np.array([19000, 41000, 80000, 29500, 14600], dtype=float),
+    rated_rpm=np.array([10000, 7000, 5000, 9000, 12000], dtype=float),
+)
+
+
+def _duty_cycle_arrays(time_series: np.ndarray, *series: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    운전 패턴 배열을 (축, 구간) 2차원으로 정리
+
+    Args:
+        time_series: 구간별 시간 배열 (구간,) 또는 (축, 구간)
+        *series: 구간별 하중/속도 배열
+
+    Returns:
+        Tuple[np.ndarray, ...]: (축, 구간) 형상의 배열들
+    """
+    arrays = [np.atleast_2d(np.asarray(a, dtype=float)) for a in (time_series, *series)]
+    if any(a.shape[-1] != arrays[0].shape[-1] for a in arrays):
+        raise ValueError("시간 배열과 하중/속도 배열의 구간 개수가 다릅니다")
+    if arrays[0].shape[-1] == 0:
+        raise ValueError("빈 배열은 처리할 수 없습니다")
+    if np.any(arrays[0] < 0):
+        raise ValueError("구간 시간은 음수일 수 없습니다")
+
+    arrays = np.broadcast_arrays(*arrays)
+    if np.any(arrays[0].sum(axis=-1) == 0):
+        raise ValueError("총 시간이 0입니다")
+    return tuple(arrays)
+
+
+def _equivalent_load(load: np.ndarray, weight: np.ndarray, exponent) -> np.ndarray:
+    """
+    변동 하중의 등가하중 P_m = (Σ|F|^p·w / Σw)^(1/p)
+
+    Args:
+        load: 구간별 하중 (..., 구간)
+        weight: 구간별 가중치 (회전수 또는 이동거리 = 속도×시간)
+        exponent: 수명 지수 p (스칼라 또는 구간 축을 뺀 형상)
+
+    Returns:
+        np.ndarray: 등가하중 (구간 축 제거)
+    """
+    total = weight.sum(axis=-1)
+    moment = (np.abs(load)**np.expand_dims(exponent, -1) * weight).sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(total > 0, moment / total, 0.0) ** (1 / exponent)
+
+
+def _rank(feasible: np.ndarray, rating: np.ndarray) -> np.ndarray:
+    """적합 모델 우선, 정격하중이 작은 순 정렬 인덱스"""
+    score = np.where(feasible, np.broadcast_to(rating, feasible.shape), np.inf)
+    return np.argsort(score, axis=1, kind="stable")
+
+
+def select_lm_guides(time_series: np.ndarray,
+                     load_n: np.ndarray,
+                     speed_mm_per_s: np.ndarray,
+                     catalog: LMGuideCatalog = THK_LM_GUIDES,
+                     load_factor: float = 1.0,
+                     duty_percent: float = 100.0,
+                     target_life_h: float = 20000.0) -> SelectionResult:
+    """
+    LM가이드 선정 (THK식 L = (C/P)^3 × 50 km)
+
+    Args:
+        time_series: 구간별 시간 (s), (구간,) 또는 (축, 구간)
+        load_n: 구간별 블록 하중 (N)
+        speed_mm_per_s: 구간별 이송 속도 (mm/s)
+        catalog: LM가이드 카탈로그
+        load_factor: 하중 계수 (운전 조건 보정)
+        duty_percent: 운전 패턴 외 간헐 운전 비율 (%)
+        target_life_h: 목표 수명 (h)
+
+    Returns:
+        SelectionResult: 축 x 모델 수명/적합 여부/순위
+    """
+    t, load, speed = _duty_cycle_arrays(time_series, load_n, speed_mm_per_s)
+    distance_mm = np.abs(speed) * t
+
+    equivalent = _equivalent_load(load, distance_mm, 3) * load_factor
+    mean_speed = distance_mm.sum(axis=1) / t.sum(axis=1) * duty_percent / 100
+
+    rating = catalog.dynamic_load_n[None, :]
+    with np.errstate(divide="ignore"):
+        life_km = (rating / equivalent[:, None])**3 * 50
+        life_h = life_km * 1e6 / (mean_speed[:, None] * 3600)
+    feasible = life_h >= target_life_h
+
+    return SelectionResult(
+        models=list(catalog.models),
+        life_h=life_h,
+        feasible=feasible,
+        ranking=_rank(feasible, rating),
+        details={"equivalent_load_n": equivalent, "life_km": life_km},
+    )
+
+
+def select_ball_screws(time_series: np.ndarray,
+                       axial_load_n: np.ndarray,
+                       speed_mm_per_s: np.ndarray,
+                       stroke_mm: np.ndarray,
+                       catalog: BallScrewCatalog = THK_BALL_SCREWS,
+                       efficiency: float = 0.9,
+                       load_factor: float = 1.0,
+                       duty_percent: float = 100.0,
+                       target_life_h: float = 20000.0,
+                       mounting: str = "고정-자유",
+                       buckling_safety: float = 0.5,
+                       critical_speed_safety: float = 0.8) -> SelectionResult:
+    """
+    볼스크류 선정 (수명 / 좌굴 / 위험 속도 / 구동 토크)
+
+    Args:
+        time_series: 구간별 시간 (s), (구간,) 또는 (축, 구간)
+        axial_load_n: 구간별 축하중 (N)
+        speed_mm_per_s: 구간별 이송 속도 (mm/s)
+        stroke_mm: 축별 스트로크 = 좌굴/위험 속도 유효 길이 (mm)
+        catalog: 볼스크류 카탈로그
+        efficiency: 볼스크류 효율 η
+        load_factor: 하중 계수
+        duty_percent: 운전 패턴 외 간헐 운전 비율 (%)
+        target_life_h: 목표 수명 (h)
+        mounting: 지지 방식 ("고정-자유", "고정-지지", "고정-고정")
+        buckling_safety: 허용 좌굴 하중 계수
+        critical_speed_safety: 허용 위험 속도 계수
+
+    Returns:
+        SelectionResult: 축 x 모델 수명/적합 여부/순위
+    """
+    if mounting not in BUCKLING_COEFFICIENTS:
+        raise ValueError(f"지원하지 않는 지지 방식입니다: {mounting}")
+    if not 0 < efficiency <= 1:
+        raise ValueError("효율은 0과 1 사이여야 합니다")
+
+    t, load, speed = _duty_cycle_arrays(time_series, axial_load_n, speed_mm_per_s)
+    length = np.broadcast_to(np.asarray(stroke_mm, dtype=float), t.shape[:1])[:, None]
+    lead = catalog.lead_mm[None, :]
+    d = catalog.shaft_diameter_mm[None, :]
+    rating = catalog.dynamic_load_n[None, :]
+    total_time = t.sum(axis=1)
+
+    # 수명: 회전수 가중 등가하중, L_rev = 1e6·(Ca/Fa)^3, L_h = L_rev / (n_avg·60)
+    distance_mm = np.abs(speed) * t
+    equivalent = _equivalent_load(load, distance_mm, 3) * load_factor
+    rpm = np.abs(speed)[:, None, :] / lead[..., None] * 60
+    mean_rpm = distance_mm.sum(axis=1)[:, None] / lead * 60 / total_time[:, None] * duty_percent / 100
+    with np.errstate(divide="ignore"):
+        life_rev = 1e6 * (rating / equivalent[:, None])**3
+        life_h = life_rev / (mean_rpm * 60)
+
+    # 좌굴: Pcr = η₁·π²·E·I / L², I = π·d⁴/64
+    inertia = math.pi * d**4 / 64
+    buckling_n = BUCKLING_COEFFICIENTS[mounting] * math.pi**2 * STEEL_ELASTIC_MODULUS * inertia / length**2
+
+    # 위험 속도: Nc = 60·λ² / (2π·L²) · √(E·10³·I / (γ·A))
+    area = math.pi * d**2 / 4
+    critical_rpm = (60 * CRITICAL_SPEED_COEFFICIENTS[mounting]**2 / (2 * math.pi * length**2)
+                    * np.sqrt(STEEL_ELASTIC_MODULUS * 1e3 * inertia / (STEEL_DENSITY * area)))
+
+    # 구동 토크: T = Fa·lead / (2π·η·1000), RMS 는 calculate_rms_torque 와 같은 시간 가중
+    torque_per_load = lead / (2 * math.pi * efficiency * 1000)
+    rms_load = np.sqrt((load**2 * t).sum(axis=1) / total_time)
+    peak_load = np.abs(load).max(axis=1)
+
+    feasible = (
+        (life_h >= target_life_h)
+        & (buckling_n * buckling_safety >= peak_load[:, None] * load_factor)
+        & (critical_rpm * critical_speed_safety >= rpm.max(axis=2))
+    )
+
+    return SelectionResult(
+        models=list(catalog.models),
+        life_h=life_h,
+        feasible=feasible,
+        ranking=_rank(feasible, rating),
+        details={
+            "equivalent_load_n": equivalent,
+            "buckling_load_n": buckling_n,
+            "critical_speed_rpm": critical_rpm,
+            "max_rpm": rpm.max(axis=2),
+            "rms_torque_nm": rms_load[:, None] * torque_per_load,
+            "peak_torque_nm": peak_load[:, None] * torque_per_load,
+        },
+    )
+
+
+def select_bearings(time_series: np.ndarray,
+                    radial_load_n: np.ndarray,
+                    axial_load_n: np.ndarray,
+                    speed_rpm: np.ndarray,
+                    catalog: BearingCatalog = EXAMPLE_BEARINGS,
+                    bearing_type: Optional[str] = None,
+                    environment_factor: float = 1.3,
+                    duty_percent: float = 100.0,
+                    target_life_h: float = 20000.0,
+                    life_safety_factor: float = 1.5) -> SelectionResult:
+    """
+    베어링 선정 (P = X·Fr + Y·Fa, L_rev = 10^6·(C/P_eff)^p)
+
+    Args:
+        time_series: 구간별 시간 (s), (구간,) 또는 (축, 구간)
+        radial_load_n: 구간별 반지름하중 Fr (N)
+        axial_load_n: 구간별 축하중 Fa (N)
+        speed_rpm: 구간별 회전속도 (rpm)
+        catalog: 베어링 카탈로그
+        bearing_type: 대상 타입 (None 이면 전체)
+        environment_factor: 환경계수 f_env (조선소 1.3~1.5)
+        duty_percent: 운전 패턴 외 간헐 운전 비율 (%)
+        target_life_h: 목표 수명 (h)
+        life_safety_factor: 목표 수명 안전계수 k_L
+
+    Returns:
+        SelectionResult: 축 x 모델 수명/적합 여부/순위
+    """
+    unknown = set(catalog.types) - set(LIFE_EXPONENTS)
+    if unknown:
+        raise ValueError(f"지원하지 않는 베어링 타입입니다: {sorted(unknown)}")
+
+    t, fr, fa, rpm = _duty_cycle_arrays(time_series, radial_load_n, axial_load_n, speed_rpm)
+    types = np.array(catalog.types)
+    exponent = np.array([LIFE_EXPONENTS[k] for k in catalog.types])[None, :]
+    ratio_limit, x_high, y_high = (np.array(v)[None, :, None] for v in zip(*(XY_FACTORS[k] for k in catalog.types)))
+
+    # 구간별 X·Y 계수: Fa/Fr 가 기준 이하이면 X=1, Y=0
+    fr3, fa3 = np.abs(fr)[:, None, :], np.abs(fa)[:, None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        low_axial = np.where(fr3 > 0, fa3 / fr3 <= ratio_limit, False)
+    x = np.where(low_axial, 1.0, x_high)
+    y = np.where(low_axial, 0.0, y_high)
+    load = (x * fr3 + y * fa3) * environment_factor
+
+    revolutions = (np.abs(rpm) * t)[:, None, :]
+    equivalent = _equivalent_load(load, revolutions, exponent)
+    mean_rpm = np.abs(rpm * t).sum(axis=1) / t.sum(axis=1) * duty_percent / 100
+
+    rating = catalog.dynamic_load_n[None, :]
+    required_life_h = target_life_h * life_safety_factor
+    with np.errstate(divide="ignore"):
+        life_rev = 1e6 * (rating / equivalent)**exponent
+        life_h = life_rev / (mean_rpm[:, None] * 60)
+    required_c = equivalent * (required_life_h * mean_rpm[:, None] * 60 / 1e6)**(1 / exponent)
+
+    feasible = (life_h >= required_life_h) & (catalog.rated_rpm[None, :] >= np.abs(rpm).max(axis=1)[:, None])
+    if bearing_type is not None:
+        feasible &= (types == bearing_type)[None, :]
+
+    return SelectionResult(
+        models=[f"{brand} {model}" for brand, model in zip(catalog.brands, catalog.models)],
+        life_h=life_h,
+        feasible=feasible,
+        ranking=_rank(feasible, rating),
+        details={"equivalent_load_n": equivalent, "required_dynamic_load_n": required_c},
+    )
+
+
+def main():
+    """메인 실행 함수 - Day1 용접로봇 Z축 예제 + 다축 일괄 선정"""
+
+    # 가속 - 등속 - 감속 - 정지 패턴 (페이로드 50kg, 300mm/s, 설계하중 = 정적×3 / 동적×5 중 큰 값)
+    g = 9.81
+    payload_kg = 50
+    operating_time = np.array([0.3, 1.4, 0.3, 2.0])
+    design_load = np.array([max(payload_kg * g * 3, payload_kg * 1.0 * 5), payload_kg * g * 3,
+                            payload_kg * g * 3, payload_kg * g * 3])
+    speed = np.array([150, 300, 150, 0])
+
+    guides = select_lm_guides(operating_time, design_load, speed, duty_percent=20)
+    screws = select_ball_screws(operating_time, design_load, speed, stroke_mm=500,
+                                duty_percent=20, mounting="고정-지지")
+    bearings = select_bearings(operating_time, np.array([3000, 3000, 3000, 0]), np.array([600, 600, 600, 0]),
+                               np.array([300, 600, 300, 0]), bearing_type="볼베어링", duty_percent=30)
+
+    print("🔩 단일 축 선정 결과")
+    print(f"   LM가이드: {guides.ranked_models(0)} (수명 {guides.life_h[0].round(0)} h)")
+    print(f"   볼스크류: {screws.ranked_models(0)} (RMS 토크 {screws.details['rms_torque_nm'][0].round(3)} N·m)")
+    print(f"   베어링: {bearings.ranked_models(0)}")
+
+    # 하중/스트로크가 다른 5000개 축 일괄 평가
+    rng = np.random.default_rng(0)
+    n_axes = 5000
+    scale = rng.uniform(0.5, 3.0, size=(n_axes, 1))
+    strokes = rng.uniform(300, 1500, size=n_axes)
+    many = select_ball_screws(operating_time, design_load * scale, speed, strokes,
+                              duty_percent=20, mounting="고정-지지")
+    counts = {model: 0 for model in many.models}
+    for model in many.best_models:
+        if model is not None:
+            counts[model] += 1
+    print(f"\n📦 {n_axes}개 축 볼스크류 추천 분포: {counts}, 부적합 {many.best_models.count(None)}개")
+
+
+if __name__ == "__main__":
+    main()
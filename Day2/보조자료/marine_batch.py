@@ -0,0 +1,339 @@
+"""
+MarineMotorCalculator 공식의 배열 일괄 계산 (float32 저정밀 모드 포함)
+
+대규모 파라미터 스윕/몬테카를로 계산에서 사양을 열(column) 배열로 묶어
+토크, 출력, 감속비, RMS 토크를 한 번에 계산합니다.
+float32 모드를 선택하면 메모리/대역폭이 절반이 되며, 계산 전에 표본 행을
+float64 경로와 비교해 최대 상대오차가 허용값을 넘으면 오류를 냅니다.
+
+주요 기능:
+- 사양 열 배열 기반 종합 계산 (perform_comprehensive_calculation 과 같은 공식)
+- float32 / float64 선택
+- RMS 합산의 보정 합(Kahan summation)
+- 내장 정밀도 검사 (표본 행 float64 대비 최대 상대오차)
+
+Author: Marine Engineering Team
+Date: 2025.08.22
+"""
+
+import math
+import time
+import logging
+import numpy as np
+from dataclasses import fields
+from typing import Dict, Optional, Sequence, Tuple
+
+from claude_code2 import (
+    ClassificationSociety,
+    MarineEnvironment,
+    MarineMotorCalculator,
+    MotorSpecification,
+)
+
+logger = logging.getLogger(__name__)
+
+NUMERIC_FIELDS = (
+    "load_capacity_ton", "operating_speed_rpm", "drum_radius_m", "system_efficiency",
+    "safety_factor", "load_inertia_kgm2", "motor_inertia_kgm2",
+)
+SUPPORTED_DTYPES = (np.float32, np.float64)
+
+
+def kahan_sum(values: np.ndarray, axis: int = -1) -> np.ndarray:
+    """
+    보정 합(Kahan summation)
+
+    저정밀 배열에서 항목 수가 많아도 반올림 오차가 누적되지 않도록
+    합산 오차를 보정항으로 따로 들고 갑니다.
+
+    Args:
+        values: 합산할 배열
+        axis: 합산 축
+
+    Returns:
+        np.ndarray: 합 (입력과 같은 dtype)
+    """
+    values = np.moveaxis(values, axis, -1)
+    total = np.zeros(values.shape[:-1], dtype=values.dtype)
+    compensation = np.zeros_like(total)
+    for i in range(values.shape[-1]):
+        y = values[..., i] - compensation
+        t = total + y
+        compensation = (t - total) - y
+        total = t
+    return total
+
+
+class MarineBatchCalculator:
+    """MarineMotorCalculator 공식 일괄 계산 클래스"""
+
+    def __init__(self,
+                 columns: Dict[str, np.ndarray],
+                 environments: Sequence[MarineEnvironment],
+                 classifications: Sequence[ClassificationSociety],
+                 dtype=np.float64,
+                 tolerance: float = 1e-5,
+                 check_sample: int = 10000,
+                 sample_seed: Optional[int] = 0):
+        """
+        초기화 메서드
+
+        Args:
+            columns: MotorSpecification 숫자 필드 이름 → 배열
+            environments: 행별 해상 환경
+            classifications: 행별 선급
+            dtype: 계산 정밀도 (np.float32 또는 np.float64)
+            tolerance: float32 모드 허용 최대 상대오차
+            check_sample: 정밀도 검사 표본 행 개수 (전체 행에서 무작위 추출)
+            sample_seed: 표본 행 추출 난수 시드
+        """
+        dtype = np.dtype(dtype).type
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError("계산 정밀도는 float32 또는 float64 여야 합니다")
+        missing = set(NUMERIC_FIELDS) - set(columns)
+        if missing:
+            raise ValueError(f"사양 열이 없습니다: {sorted(missing)}")
+
+        self.dtype = dtype
+        self.tolerance = tolerance
+        raw_columns = {name: np.asarray(columns[name]) for name in NUMERIC_FIELDS}
+        self.n_rows = len(raw_columns["load_capacity_ton"])
+        if any(len(col) != self.n_rows for col in raw_columns.values()) \
+                or len(environments) != self.n_rows or len(classifications) != self.n_rows:
+            raise ValueError("사양 열의 길이가 서로 다릅니다")
+
+        # 규정표 계수는 float64 로 곱한 뒤 계산 정밀도로 변환
+        env_totals = {env: c["salt"] * c["temp"] * c["vibration"]
+                      for env, c in MarineMotorCalculator.ENVIRONMENTAL_CORRECTIONS.items()}
+        correction_factor = np.array(
+            [env_totals[env] * MarineMotorCalculator.SAFETY_FACTORS.get(cls, 2.0)
+             for env, cls in zip(environments, classifications)],
+            dtype=np.float64,
+        )
+
+        # 정밀도 검사용 표본 행만 변환 전 float64 사본으로 보관
+        rng = np.random.default_rng(sample_seed)
+        self.sample_rows = np.sort(rng.choice(self.n_rows, size=min(check_sample, self.n_rows), replace=False))
+        self._sample_columns = {name: col[self.sample_rows].astype(np.float64) for name, col in raw_columns.items()}
+        self._sample_correction = correction_factor[self.sample_rows]
+
+        # 전체 열은 float64 로 보관하지 않고 바로 계산 정밀도로 변환
+        self.columns = {name: col.astype(dtype, copy=False) for name, col in raw_columns.items()}
+        self.correction_factor = correction_factor.astype(dtype, copy=False)
+        self._validate_inputs()
+        self.precision_report: Optional[Dict[str, float]] = None
+        logger.info(f"일괄 계산기 초기화: {self.n_rows:,}행, {np.dtype(dtype).name}")
+
+    @classmethod
+    def from_specifications(cls, specs: Sequence[MotorSpecification], **kwargs) -> "MarineBatchCalculator":
+        """MotorSpecification 목록으로 생성"""
+        columns = {f.name: np.array([getattr(s, f.name) for s in specs])
+                   for f in fields(MotorSpecification) if f.name in NUMERIC_FIELDS}
+        return cls(columns, [s.environment for s in specs], [s.classification for s in specs], **kwargs)
+
+    def _validate_inputs(self) -> None:
+        """입력값 유효성 검증 (MarineMotorCalculator 와 같은 조건)"""
+        c = self.columns
+        validations = [
+            (c["load_capacity_ton"] > 0, "하중 용량은 0보다 커야 합니다"),
+            (c["operating_speed_rpm"] > 0, "운전 속도는 0보다 커야 합니다"),
+            (c["drum_radius_m"] > 0, "드럼 반지름은 0보다 커야 합니다"),
+            ((0 < c["system_efficiency"]) & (c["system_efficiency"] <= 1), "시스템 효율은 0과 1 사이여야 합니다"),
+            (c["safety_factor"] > 1, "안전율은 1보다 커야 합니다"),
+            (c["load_inertia_kgm2"] > 0, "부하 관성은 0보다 커야 합니다"),
+            (c["motor_inertia_kgm2"] > 0, "모터 관성은 0보다 커야 합니다"),
+            (c["drum_radius_m"] <= 5.0, "드럼 반지름이 비현실적으로 큽니다 (5m 초과)")
+        ]
+
+        for condition, message in validations:
+            if not np.all(condition):
+                logger.error(f"입력값 검증 실패: {message} ({int((~condition).sum()):,}행)")
+                raise ValueError(message)
+
+    def _kernels(self, columns: Dict[str, np.ndarray], correction_factor: np.ndarray,
+                 time_series: Optional[np.ndarray], torque_series: Optional[np.ndarray]) -> Dict[str, np.ndarray]:
+        """종합 계산 공식 (columns 의 dtype 으로 계산)"""
+        dtype = correction_factor.dtype.type
+        force_n = columns["load_capacity_ton"] * dtype(1000 * MarineMotorCalculator.GRAVITY_ACCELERATION)
+        basic_torque = force_n * columns["drum_radius_m"] / columns["system_efficiency"]
+        required_torque = basic_torque * correction_factor * columns["safety_factor"]
+
+        power_scale = dtype(MarineMotorCalculator.RPM_TO_RADIAN_PER_SEC / MarineMotorCalculator.WATT_TO_KILOWATT)
+        power_kw = required_torque * columns["operating_speed_rpm"] * power_scale
+
+        optimal_gear = np.sqrt(columns["load_inertia_kgm2"] / columns["motor_inertia_kgm2"])
+        minimum_gear = optimal_gear / dtype(math.sqrt(10))
+
+        results = {
+            "required_torque_nm": required_torque,
+            "motor_power_kw": power_kw,
+            "optimal_gear_ratio": optimal_gear,
+            "minimum_gear_ratio": minimum_gear,
+        }
+        if time_series is not None and torque_series is not None:
+            # 공통 패턴(1행)은 한 번만 계산한 뒤 결과만 행 수로 확장 (행 × 구간 임시 배열 방지)
+            rms = self._rms_torque(time_series.astype(dtype), torque_series.astype(dtype))
+            results["rms_torque_nm"] = np.broadcast_to(rms, required_torque.shape).copy()
+        return results
+
+    def _prepare_series(self, time_series: Optional[np.ndarray],
+                        torque_series: Optional[np.ndarray]) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        운전 패턴 배열 형상 검증 (입력 정밀도 그대로 유지)
+
+        Args:
+            time_series: 시간 배열 (구간,) 또는 (1 또는 행, 구간)
+            torque_series: 토크 배열 (구간,) 또는 (1 또는 행, 구간)
+
+        Returns:
+            Tuple: (시간 배열, 토크 배열), 각각 (1 또는 행, 구간) 형상
+        """
+        if time_series is None or torque_series is None:
+            return None, None
+        time_series = np.atleast_2d(np.asarray(time_series))
+        torque_series = np.atleast_2d(np.asarray(torque_series))
+        if time_series.shape[-1] != torque_series.shape[-1]:
+            raise ValueError("시간 배열과 토크 배열의 길이가 다릅니다")
+        if time_series.shape[-1] == 0:
+            raise ValueError("빈 배열은 처리할 수 없습니다")
+
+        n_series = max(time_series.shape[0], torque_series.shape[0])
+        if n_series not in (1, self.n_rows) or {time_series.shape[0], torque_series.shape[0]} - {1, n_series}:
+            raise ValueError(f"운전 패턴 행 수는 1 또는 사양 행 수({self.n_rows:,})여야 합니다")
+        shape = (n_series, time_series.shape[-1])
+        return np.broadcast_to(time_series, shape), np.broadcast_to(torque_series, shape)
+
+    @staticmethod
+    def _rms_torque(time_series: np.ndarray, torque_series: np.ndarray) -> np.ndarray:
+        """
+        행별 RMS 토크 (NaN 구간 제외, 보정 합)
+
+        Args:
+            time_series: 시간 배열 (행, 구간)
+            torque_series: 토크 배열 (행, 구간)
+
+        Returns:
+            np.ndarray: 행별 RMS 토크 (N·m)
+        """
+        valid = ~(np.isnan(time_series) | np.isnan(torque_series))
+        t = np.where(valid, time_series, 0)
+        torque = np.where(valid, torque_series, 0)
+
+        total_time = kahan_sum(t)
+        if np.any(total_time == 0):
+            raise ValueError("총 시간이 0입니다")
+        return np.sqrt(kahan_sum(torque**2 * t) / total_time)
+
+    def check_precision(self,
+                        time_series: Optional[np.ndarray] = None,
+                        torque_series: Optional[np.ndarray] = None) -> Dict[str, float]:
+        """
+        표본 행을 float64 경로와 비교한 최대 상대오차
+
+        float64 기준값은 변환 전 입력 사본으로 계산하므로 입력 반올림 오차도
+        포함됩니다. 기준값이 0이면 절대오차를 쓰고, 오차가 유한하지 않으면 실패입니다.
+
+        Args:
+            time_series: 시간 배열 (구간,) 또는 (1 또는 행, 구간), 선택적
+            torque_series: 토크 배열 (구간,) 또는 (1 또는 행, 구간), 선택적
+
+        Returns:
+            Dict[str, float]: 결과 이름 → 최대 상대오차
+        """
+        time_series, torque_series = self._prepare_series(time_series, torque_series)
+        # 행별 패턴만 표본 행을 뽑고, 공통 패턴은 1행 그대로 계산
+        if time_series is not None and time_series.shape[0] > 1:
+            time_series, torque_series = time_series[self.sample_rows], torque_series[self.sample_rows]
+
+        reduced = self._kernels({k: v.astype(self.dtype) for k, v in self._sample_columns.items()},
+                                self._sample_correction.astype(self.dtype), time_series, torque_series)
+        reference = self._kernels(self._sample_columns, self._sample_correction, time_series, torque_series)
+
+        report = {}
+        for name, ref in reference.items():
+            value = reduced[name].astype(np.float64)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                error = np.where(ref == 0, np.abs(value - ref), np.abs(value - ref) / np.abs(ref))
+            error = np.where(np.isfinite(error), error, np.inf)
+            report[name] = float(error.max())
+        self.precision_report = report
+        logger.info(f"정밀도 검사 ({np.dtype(self.dtype).name}): 최대 상대오차 {max(report.values()):.2e}")
+
+        exceeded = {name: err for name, err in report.items() if err > self.tolerance}
+        if exceeded:
+            message = f"저정밀 계산 오차가 허용값 {self.tolerance:g} 을 넘습니다: {exceeded}"
+            logger.error(message)
+            raise ValueError(message)
+        return report
+
+    def perform_batch_calculation(self,
+                                  time_series: Optional[np.ndarray] = None,
+                                  torque_series: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        일괄 종합 계산 수행
+
+        float32 모드에서는 먼저 check_precision 을 실행합니다.
+
+        Args:
+            time_series: 시간 배열 (구간,) 또는 (1 또는 행, 구간), 선택적
+            torque_series: 토크 배열 (구간,) 또는 (1 또는 행, 구간), 선택적
+
+        Returns:
+            Dict[str, np.ndarray]: 결과 이름 → 행별 배열
+        """
+        time_series, torque_series = self._prepare_series(time_series, torque_series)
+        if self.dtype is np.float32:
+            self.check_precision(time_series, torque_series)
+        return self._kernels(self.columns, self.correction_factor, time_series, torque_series)
+
+
+def main():
+    """메인 실행 함수 - float64 / float32 스윕 비교"""
+
+    rng = np.random.default_rng(0)
+    n_rows = 2_000_000
+    columns = {
+        "load_capacity_ton": rng.uniform(5, 100, n_rows),
+        "operating_speed_rpm": rng.choice([1450.0, 1750.0, 1800.0], n_rows),
+        "drum_radius_m": rng.uniform(0.3, 2.0, n_rows),
+        "system_efficiency": rng.uniform(0.75, 0.95, n_rows),
+        "safety_factor": rng.uniform(1.1, 1.5, n_rows),
+        "load_inertia_kgm2": rng.uniform(500, 10000, n_rows),
+        "motor_inertia_kgm2": rng.uniform(20, 300, n_rows),
+    }
+    envs = list(MarineEnvironment)
+    environments = [envs[i] for i in rng.integers(0, len(envs), n_rows)]
+    classifications = [ClassificationSociety.DNV] * n_rows
+
+    # 운전 패턴: 행마다 다른 1000구간 (정밀도 검사에서 보정 합 효과 확인)
+    n_segments = 1000
+    time_series = rng.uniform(0.1, 10, (n_rows // 100, n_segments))
+    torque_series = rng.uniform(0, 150000, (n_rows // 100, n_segments))
+
+    print(f"📦 {n_rows:,}행 일괄 계산\n")
+    for dtype in (np.float64, np.float32):
+        calculator = MarineBatchCalculator(columns, environments, classifications, dtype=dtype)
+        start = time.perf_counter()
+        results = calculator.perform_batch_calculation()
+        elapsed = time.perf_counter() - start
+        memory_mb = sum(col.nbytes for col in calculator.columns.values()) / 1e6
+        print(f"{np.dtype(dtype).name}: {elapsed * 1000:.0f} ms, 사양 열 {memory_mb:.0f} MB, "
+              f"토크 평균 {results['required_torque_nm'].mean():,.0f} N·m")
+        if calculator.precision_report:
+            for name, err in calculator.precision_report.items():
+                print(f"   {name}: 최대 상대오차 {err:.2e}")
+
+    # RMS 합산: 보정 합 vs 단순 float32 합
+    rms_calc = MarineBatchCalculator({k: v[:len(time_series)] for k, v in columns.items()},
+                                     environments[:len(time_series)], classifications[:len(time_series)],
+                                     dtype=np.float32)
+    rms = rms_calc.perform_batch_calculation(time_series, torque_series)["rms_torque_nm"]
+    t32, q32 = time_series.astype(np.float32), torque_series.astype(np.float32)
+    naive = np.sqrt(np.cumsum(q32**2 * t32, axis=1)[:, -1] / np.cumsum(t32, axis=1)[:, -1])
+    exact = np.sqrt((torque_series**2 * time_series).sum(axis=1) / time_series.sum(axis=1))
+    print(f"\n📈 RMS 토크 ({n_segments}구간) float32 최대 상대오차: "
+          f"보정 합 {np.max(np.abs(rms - exact) / exact):.2e}, 단순 합 {np.max(np.abs(naive - exact) / exact):.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+모터 계산 결과 영구 저장소 (SQLite 기반 내용 주소 캐시)
+
+규정표나 카탈로그가 바뀔 때마다 전체 선단 계산을 다시 돌리지 않도록,
+입력값 + 규정표 + 코드 버전의 해시를 키로 결과를 디스크에 저장합니다.
+
+주요 기능:
+- MotorSpecification / size_hoist_motor 입력의 내용 해시 키 생성
+- 다중 프로세스에서 함께 쓸 수 있는 SQLite(WAL) 저장소
+- 일괄 조회/일괄 저장 (변경된 행만 재계산)
+
+Author: Marine Engineering Team
+Date: 2025.08.22
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import sqlite3
+from dataclasses import asdict
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+import claude_code2
+import gpt_code
+from claude_code2 import (
+    CalculationResult,
+    ClassificationSociety,
+    MarineEnvironment,
+    MarineMotorCalculator,
+    MotorSpecification,
+)
+from gpt_code import size_hoist_motor
+
+logger = logging.getLogger(__name__)
+
+# SQLite 한 문장에 넣을 수 있는 파라미터 개수 제한 대응
+_SQL_BATCH_SIZE = 900
+
+
+@lru_cache(maxsize=None)
+def _code_version(module) -> str:
+    """모듈 소스 파일 해시 (코드가 바뀌면 캐시 키도 바뀜)"""
+    return hashlib.sha256(Path(module.__file__).read_bytes()).hexdigest()
+
+
+def _json_default(value):
+    """해시/저장용 JSON 직렬화 보조 함수"""
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, (np.integer, np.floating)):
+        return float(value)
+    if isinstance(value, np.ndarray):
+        return value.astype(float).tolist()
+    raise TypeError(f"직렬화할 수 없는 값입니다: {type(value).__name__}")
+
+
+def _content_hash(payload) -> str:
+    """입력 내용의 SHA-256 해시"""
+    text = json.dumps(payload, sort_keys=True, default=_json_default, ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _as_stored(value: dict) -> dict:
+    """저장소에서 읽은 것과 같은 형태로 변환 (numpy 수치 → float, 첫 실행과 캐시 적중의 반환 형식 통일)"""
+    return json.loads(json.dumps(value, default=_json_default, ensure_ascii=False))
+
+
+def _normalize_numbers(values: Dict[str, object]) -> Dict[str, object]:
+    """숫자 값을 float 로 통일 (50 과 50.0, np.int64 가 같은 키가 되도록)"""
+    return {
+        k: float(v) if isinstance(v, (int, float, np.integer, np.floating)) and not isinstance(v, bool) else v
+        for k, v in values.items()
+    }
+
+
+def _rule_tables() -> Dict[str, Dict[str, object]]:
+    """MarineMotorCalculator 규정표 (안전율, 환경 보정 계수)"""
+    return {
+        "safety_factors": {k.name: v for k, v in MarineMotorCalculator.SAFETY_FACTORS.items()},
+        "environmental_corrections": {k.name: v for k, v in MarineMotorCalculator.ENVIRONMENTAL_CORRECTIONS.items()},
+    }
+
+
+def _specification_context() -> str:
+    """종합 계산 공통 키 요소 (규정표 + 코드 버전) 해시"""
+    return _content_hash({"rules": _rule_tables(), "code": _code_version(claude_code2)})
+
+
+def _hoist_context() -> str:
+    """size_hoist_motor 공통 키 요소 (표준 출력표 + 코드 버전) 해시"""
+    return _content_hash({"standard_powers": gpt_code.STANDARD_POWERS, "code": _code_version(gpt_code)})
+
+
+def specification_key(spec: MotorSpecification,
+                      time_series: Optional[np.ndarray] = None,
+                      torque_series: Optional[np.ndarray] = None,
+                      context: Optional[str] = None) -> str:
+    """
+    종합 계산 결과 캐시 키 생성
+
+    Args:
+        spec: 모터 사양
+        time_series: 시간 배열 (선택적)
+        torque_series: 토크 배열 (선택적)
+        context: 규정표 + 코드 버전 해시 (일괄 처리 시 재사용, 기본값: 새로 계산)
+
+    Returns:
+        str: 사양 + 규정표 + 코드 버전 해시
+    """
+    return _content_hash({
+        "spec": _normalize_numbers(asdict(spec)),
+        "time_series": time_series,
+        "torque_series": torque_series,
+        "context": context or _specification_context(),
+    })
+
+
+def hoist_key(inputs: Dict[str, float], context: Optional[str] = None) -> str:
+    """
+    size_hoist_motor 결과 캐시 키 생성
+
+    Args:
+        inputs: size_hoist_motor 키워드 인자
+        context: 표준 출력표 + 코드 버전 해시 (일괄 처리 시 재사용, 기본값: 새로 계산)
+
+    Returns:
+        str: 입력 + 표준 출력표 + 코드 버전 해시
+    """
+    bound = inspect.signature(size_hoist_motor).bind(**inputs)
+    bound.apply_defaults()
+    return _content_hash({"inputs": _normalize_numbers(bound.arguments), "context": context or _hoist_context()})
+
+
+class ResultStore:
+    """SQLite 기반 계산 결과 저장소"""
+
+    def __init__(self, path: str = "motor_results.sqlite", timeout_s: float = 30.0):
+        """
+        초기화 메서드
+
+        Args:
+            path: SQLite 파일 경로
+            timeout_s: 다른 프로세스의 쓰기 잠금 대기 시간 (s)
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=timeout_s)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "kind TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "PRIMARY KEY (kind, key))"
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """연결 종료"""
+        self._conn.close()
+
+    def get_many(self, kind: str, keys: Iterable[str]) -> Dict[str, dict]:
+        """
+        일괄 조회
+
+        Args:
+            kind: 결과 종류 ("comprehensive", "hoist" 등)
+            keys: 캐시 키 목록
+
+        Returns:
+            Dict[str, dict]: 저장소에 있는 키 → 결과
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        for start in range(0, len(keys), _SQL_BATCH_SIZE):
+            batch = keys[start:start + _SQL_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key, value FROM results WHERE kind = ? AND key IN ({placeholders})",
+                [kind, *batch],
+            )
+            found.update((key, json.loads(value)) for key, value in rows)
+        return found
+
+    def put_many(self, kind: str, items: Dict[str, dict]) -> None:
+        """
+        일괄 저장 (단일 트랜잭션)
+
+        Args:
+            kind: 결과 종류
+            items: 캐시 키 → 결과
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results (kind, key, value) VALUES (?, ?, ?)",
+                [(kind, key, json.dumps(value, default=_json_default, ensure_ascii=False))
+                 for key, value in items.items()],
+            )
+
+
+def calculate_many(store: ResultStore,
+                   specs: Sequence[MotorSpecification],
+                   time_series: Optional[np.ndarray] = None,
+                   torque_series: Optional[np.ndarray] = None) -> List[CalculationResult]:
+    """
+    저장소를 거쳐 종합 계산 일괄 수행 (저장소에 없는 사양만 계산)
+
+    Args:
+        store: 결과 저장소
+        specs: 모터 사양 목록
+        time_series: 모든 사양에 공통인 시간 배열 (선택적)
+        torque_series: 모든 사양에 공통인 토크 배열 (선택적)
+
+    Returns:
+        List[CalculationResult]: specs 순서의 계산 결과
+    """
+    context = _specification_context()
+    keys = [specification_key(spec, time_series, torque_series, context) for spec in specs]
+    cached = store.get_many("comprehensive", keys)
+
+    computed = {}
+    for key, spec in zip(keys, specs):
+        if key in cached or key in computed:
+            continue
+        result = MarineMotorCalculator(spec).perform_comprehensive_calculation(time_series, torque_series)
+        computed[key] = _as_stored(asdict(result))
+    store.put_many("comprehensive", computed)
+
+    logger.info(f"종합 계산: {len(specs)}건 중 {len(computed)}건 계산, 나머지 저장소 사용")
+    cached.update(computed)
+    return [CalculationResult(**cached[key]) for key in keys]
+
+
+def size_hoist_motor_many(store: ResultStore, cases: Sequence[Dict[str, float]]) -> List[Dict[str, float]]:
+    """
+    저장소를 거쳐 size_hoist_motor 일괄 수행 (저장소에 없는 입력만 계산)
+
+    Args:
+        store: 결과 저장소
+        cases: size_hoist_motor 키워드 인자 목록
+
+    Returns:
+        List[Dict[str, float]]: cases 순서의 계산 결과
+    """
+    context = _hoist_context()
+    keys = [hoist_key(case, context) for case in cases]
+    cached = store.get_many("hoist", keys)
+
+    computed = {}
+    for key, case in zip(keys, cases):
+        if key not in cached and key not in computed:
+            computed[key] = _as_stored(size_hoist_motor(**case))
+    store.put_many("hoist", computed)
+
+    logger.info(f"권상 모터 계산: {len(cases)}건 중 {len(computed)}건 계산, 나머지 저장소 사용")
+    cached.update(computed)
+    return [cached[key] for key in keys]
+
+
+def main():
+    """메인 실행 함수 - 선단 재계산 예제"""
+
+    fleet = [
+        MotorSpecification(
+            load_capacity_ton=load, operating_speed_rpm=1800, drum_radius_m=1.2,
+            system_efficiency=0.85, safety_factor=1.2, load_inertia_kgm2=4250,
+            motor_inertia_kgm2=125, environment=env, classification=ClassificationSociety.DNV
+        )
+        for load in (20.0, 35.0, 50.0)
+        for env in MarineEnvironment
+    ]
+    hoists = [{"load_ton": load, "speed_m_per_min": 10} for load in (20, 35, 50)]
+
+    with ResultStore("motor_results.sqlite") as store:
+        # 두 번째 실행부터는 저장소에서 바로 읽어옴
+        results = calculate_many(store, fleet)
+        hoist_results = size_hoist_motor_many(store, hoists)
+
+    for spec, result in zip(fleet, results):
+        print(f"{spec.load_capacity_ton:>5.1f}톤 {spec.environment.value}: "
+              f"{result.required_torque_nm:,.0f} N·m, {result.motor_power_kw:,.1f} kW")
+    for case, result in zip(hoists, hoist_results):
+        print(f"권상 {case['load_ton']}톤: {result['selected_power_kw']} kW, 감속비 {result['gear_ratio']:.1f}:1")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+"""
+해상 파랑 앙상블 기반 권상 로프 동하중 시뮬레이션
+
+Day5 hoist 시뮬레이션과 같은 방식으로, 선체 상하운동(heave)에 따라
+탄성 로프에 걸리는 하중을 시간 적분하여 드럼 토크의 최대값/RMS 분포를 구합니다.
+
+주요 기능:
+- JONSWAP 스펙트럼 기반 불규칙파 다수 실현(realization) 생성
+- 탄성 로프 + 화물 질량계의 벡터화 시간 적분 (로프 처짐/스냅 하중 포함)
+- 실현 묶음 단위 다중 프로세스 병렬 실행
+- 시뮬레이션 동하중 계수로 진동 보정을 대체하는 근해/원해 모터 계산기
+
+Author: Marine Engineering Team
+Date: 2025.08.22
+"""
+
+import math
+import numpy as np
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+from dataclasses import astuple, dataclass
+
+from claude_code2 import (
+    MarineMotorCalculator,
+    MotorSpecification,
+    MarineEnvironment,
+    ClassificationSociety,
+    generate_detailed_report,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SeaState:
+    """해상 상태 데이터 클래스"""
+    significant_wave_height_m: float     # 유의파고 Hs
+    peak_period_s: float                 # 첨두주기 Tp
+    peak_enhancement: float = 3.3        # JONSWAP 첨두 증폭계수 γ
+    heave_rao: float = 1.0               # 파고 → 크레인 붐 끝단 상하운동 전달계수
+
+
+@dataclass
+class ElasticRope:
+    """탄성 로프 데이터 클래스"""
+    length_m: float = 30.0               # 붐 끝단 ~ 화물 로프 길이
+    axial_stiffness_n: float = 8.0e7     # 로프 축강성 EA (N)
+    damping_ratio: float = 0.05          # 로프 감쇠비
+
+    @property
+    def stiffness_n_per_m(self) -> float:
+        """로프 스프링 상수 k = EA / L (N/m)"""
+        return self.axial_stiffness_n / self.length_m
+
+
+@dataclass
+class SeaStateSimulationResult:
+    """시뮬레이션 결과 데이터 클래스 (실현별 배열)"""
+    peak_torque_nm: np.ndarray
+    rms_torque_nm: np.ndarray
+    slack_ratio: np.ndarray
+    static_torque_nm: float
+
+    @property
+    def dynamic_amplification(self) -> np.ndarray:
+        """실현별 동하중 계수 (최대 토크 / 정하중 토크)"""
+        return self.peak_torque_nm / self.static_torque_nm
+
+    def peak_torque_percentile(self, percentile: float = 95.0) -> float:
+        """최대 토크 분포의 백분위수 (N·m)"""
+        return float(np.percentile(self.peak_torque_nm, percentile))
+
+
+# 환경별 대표 설계 해상 상태
+SEA_STATES = {
+    MarineEnvironment.OFFSHORE: SeaState(significant_wave_height_m=2.5, peak_period_s=8.0, heave_rao=0.6),
+    MarineEnvironment.DEEP_SEA: SeaState(significant_wave_height_m=4.0, peak_period_s=10.0, heave_rao=0.5),
+}
+
+# 로프 장력 앙상블 캐시: (화물 질량, 로프, 해상 상태, 시뮬레이션 조건) → (최대 장력, RMS 장력, 처짐 비율)
+# 장력은 드럼 반지름/효율과 무관하므로 같은 하중·해상 상태의 사양끼리 공유
+_TENSION_ENSEMBLE_CACHE: Dict[Tuple, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+
+def jonswap_spectrum(omega: np.ndarray, sea_state: SeaState) -> np.ndarray:
+    """
+    JONSWAP 파랑 스펙트럼 계산
+
+    Args:
+        omega: 각주파수 배열 (rad/s)
+        sea_state: 해상 상태
+
+    Returns:
+        np.ndarray: 스펙트럼 밀도 S(ω) (m²·s/rad)
+    """
+    hs = sea_state.significant_wave_height_m
+    omega_p = 2 * math.pi / sea_state.peak_period_s
+    gamma = sea_state.peak_enhancement
+
+    sigma = np.where(omega <= omega_p, 0.07, 0.09)
+    pierson_moskowitz = (5.0 / 16.0) * hs**2 * omega_p**4 / omega**5 * np.exp(-1.25 * (omega_p / omega)**4)
+    peak_shape = gamma ** np.exp(-((omega - omega_p)**2) / (2 * sigma**2 * omega_p**2))
+    normalization = 1 - 0.287 * math.log(gamma)
+    return normalization * pierson_moskowitz * peak_shape
+
+
+def _simulate_chunk(args: Tuple) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    실현 묶음 하나의 시간 적분 (프로세스 풀 작업 단위)
+
+    Args:
+        args: (위상 배열, 성분 진폭, 성분 각주파수, 화물 질량, 로프 k, 로프 c,
+               시간 간격, 스텝 수)
+
+    Returns:
+        Tuple: (실현별 최대 장력, RMS 장력, 로프 처짐 시간 비율)
+    """
+    phases, amplitudes, omegas, mass_kg, k, c, dt, n_steps = args
+    g = MarineMotorCalculator.GRAVITY_ACCELERATION
+
+    # 붐 끝단 변위/속도: z = A·cos(ωt) + B·sin(ωt) 를 행렬곱으로 한 번에 계산
+    t = np.arange(n_steps) * dt
+    cos_wt = np.cos(np.outer(omegas, t))
+    sin_wt = np.sin(np.outer(omegas, t))
+    a_coef = amplitudes * np.cos(phases)
+    b_coef = -amplitudes * np.sin(phases)
+    tip_disp = a_coef @ cos_wt + b_coef @ sin_wt
+    tip_vel = -(a_coef * omegas) @ sin_wt + (b_coef * omegas) @ cos_wt
+
+    # 화물 변위/속도 (정적 평형 기준), 초기 로프 신장 변화 0
+    x = tip_disp[:, 0].copy()
+    v = tip_vel[:, 0].copy()
+    static_tension = mass_kg * g
+
+    peak_tension = np.full(x.shape, static_tension)
+    tension_sq_sum = np.zeros_like(x)
+    slack_steps = np.zeros_like(x)
+
+    for i in range(n_steps):
+        tension = static_tension + k * (tip_disp[:, i] - x) + c * (tip_vel[:, i] - v)
+        slack = tension < 0
+        tension[slack] = 0.0  # 로프는 압축을 받지 못함
+
+        np.maximum(peak_tension, tension, out=peak_tension)
+        tension_sq_sum += tension**2
+        slack_steps += slack
+
+        # 반암시적 오일러 적분
+        v += (tension - static_tension) / mass_kg * dt
+        x += v * dt
+
+    return peak_tension, np.sqrt(tension_sq_sum / n_steps), slack_steps / n_steps
+
+
+def simulate_sea_state_ensemble(spec: MotorSpecification,
+                                sea_state: Optional[SeaState] = None,
+                                rope: Optional[ElasticRope] = None,
+                                n_realizations: int = 200,
+                                duration_s: float = 180.0,
+                                time_step_s: float = 0.01,
+                                n_wave_components: int = 64,
+                                chunk_size: int = 256,
+                                n_workers: int = 1,
+                                seed: Optional[int] = None) -> SeaStateSimulationResult:
+    """
+    불규칙파 앙상블 로프 하중 시뮬레이션
+
+    위상은 부모 프로세스에서 한 번에 생성하므로 n_workers 값과 무관하게
+    같은 seed는 같은 결과를 줍니다. 로프 장력 앙상블은 (화물 질량, 로프, 해상 상태,
+    시뮬레이션 조건) 별로 모듈 캐시에 보관하여, 드럼 반지름/효율만 다른 사양은
+    시간 적분 없이 토크로 환산합니다 (seed=None 이어도 같은 조건이면 재사용).
+
+    Args:
+        spec: 모터 사양
+        sea_state: 해상 상태 (기본값: 사양 환경의 대표 해상 상태)
+        rope: 탄성 로프 (기본값: ElasticRope())
+        n_realizations: 파랑 실현 개수
+        duration_s: 실현당 시뮬레이션 시간 (s)
+        time_step_s: 최대 적분 시간 간격 (s), 로프 고유진동수에 맞춰 자동으로 줄임
+        n_wave_components: 파랑 스펙트럼 분할 성분 개수
+        chunk_size: 작업 단위 실현 개수
+        n_workers: 프로세스 개수 (1이면 현재 프로세스에서 실행)
+        seed: 난수 시드
+
+    Returns:
+        SeaStateSimulationResult: 실현별 드럼 토크 통계
+    """
+    if sea_state is None:
+        if spec.environment not in SEA_STATES:
+            raise ValueError(f"{spec.environment.value} 환경의 대표 해상 상태가 없습니다")
+        sea_state = SEA_STATES[spec.environment]
+    rope = rope or ElasticRope()
+
+    if n_realizations <= 0 or chunk_size <= 0 or n_workers <= 0:
+        raise ValueError("실현 개수, 묶음 크기, 프로세스 개수는 0보다 커야 합니다")
+    if duration_s <= 0 or time_step_s <= 0:
+        raise ValueError("시뮬레이션 시간과 시간 간격은 0보다 커야 합니다")
+    if n_wave_components < 2:
+        raise ValueError("파랑 스펙트럼 분할 성분 개수는 2 이상이어야 합니다")
+
+    mass_kg = spec.load_capacity_ton * 1000
+    cache_key = (float(mass_kg), astuple(rope), astuple(sea_state),
+                 n_realizations, float(duration_s), float(time_step_s), n_wave_components, seed)
+    if cache_key not in _TENSION_ENSEMBLE_CACHE:
+        _TENSION_ENSEMBLE_CACHE[cache_key] = _simulate_tension_ensemble(
+            mass_kg, sea_state, rope, n_realizations, duration_s, time_step_s,
+            n_wave_components, chunk_size, n_workers, seed
+        )
+    peak_tension, rms_tension, slack_ratio = _TENSION_ENSEMBLE_CACHE[cache_key]
+
+    torque_per_tension = spec.drum_radius_m / spec.system_efficiency
+    peak_torque = peak_tension * torque_per_tension
+    static_torque = mass_kg * MarineMotorCalculator.GRAVITY_ACCELERATION * torque_per_tension
+
+    logger.info(f"해상 앙상블 시뮬레이션 완료: {n_realizations}개 실현, "
+                f"최대 토크 중앙값 {np.median(peak_torque):,.0f} N·m")
+    return SeaStateSimulationResult(
+        peak_torque_nm=peak_torque,
+        rms_torque_nm=rms_tension * torque_per_tension,
+        slack_ratio=slack_ratio.copy(),
+        static_torque_nm=static_torque,
+    )
+
+
+def _simulate_tension_ensemble(mass_kg: float,
+                               sea_state: SeaState,
+                               rope: ElasticRope,
+                               n_realizations: int,
+                               duration_s: float,
+                               time_step_s: float,
+                               n_wave_components: int,
+                               chunk_size: int,
+                               n_workers: int,
+                               seed: Optional[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    불규칙파 앙상블 로프 장력 시간 적분 (인자는 simulate_sea_state_ensemble 참고)
+
+    Returns:
+        Tuple: (실현별 최대 장력, RMS 장력, 로프 처짐 시간 비율)
+    """
+    k = rope.stiffness_n_per_m
+    c = 2 * rope.damping_ratio * math.sqrt(k * mass_kg)
+    natural_frequency = math.sqrt(k / mass_kg)
+    # 반암시적 오일러 안정/정확도 조건: ω_n·dt ≤ 0.2
+    time_step_s = min(time_step_s, 0.2 / natural_frequency)
+
+    # 스펙트럼 분할: 첨두 주파수의 0.5 ~ 3배 구간
+    omega_p = 2 * math.pi / sea_state.peak_period_s
+    omegas = np.linspace(0.5 * omega_p, 3.0 * omega_p, n_wave_components)
+    d_omega = omegas[1] - omegas[0]
+    amplitudes = sea_state.heave_rao * np.sqrt(2 * jonswap_spectrum(omegas, sea_state) * d_omega)
+
+    rng = np.random.default_rng(seed)
+    phases = rng.uniform(0, 2 * math.pi, size=(n_realizations, n_wave_components))
+    n_steps = max(1, int(round(duration_s / time_step_s)))
+
+    jobs = [
+        (phases[start:start + chunk_size], amplitudes, omegas, mass_kg, k, c, time_step_s, n_steps)
+        for start in range(0, n_realizations, chunk_size)
+    ]
+    if n_workers == 1:
+        outputs = [_simulate_chunk(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            outputs = list(executor.map(_simulate_chunk, jobs))
+
+    return tuple(np.concatenate(parts) for parts in zip(*outputs))
+
+
+class SeaStateMotorCalculator(MarineMotorCalculator):
+    """시뮬레이션 동하중 계수로 진동 보정을 대체하는 모터 계산기"""
+
+    def __init__(self, specification: MotorSpecification,
+                 sea_state: Optional[SeaState] = None,
+                 rope: Optional[ElasticRope] = None,
+                 design_percentile: float = 95.0,
+                 **simulation_options):
+        """
+        초기화 메서드
+
+        Args:
+            specification: 모터 사양 객체
+            sea_state: 해상 상태 (기본값: 사양 환경의 대표 해상 상태)
+            rope: 탄성 로프
+            design_percentile: 설계 기준 최대 토크 백분위수
+            **simulation_options: simulate_sea_state_ensemble 추가 인자
+        """
+        super().__init__(specification)
+        self.sea_state = sea_state
+        self.rope = rope
+        self.design_percentile = design_percentile
+        self.simulation_options = simulation_options
+        self._simulation: Optional[SeaStateSimulationResult] = None
+
+    @property
+    def simulation(self) -> SeaStateSimulationResult:
+        """앙상블 시뮬레이션 결과 (최초 접근 시 1회 실행, 장력 앙상블은 모듈 캐시 공유)"""
+        if self._simulation is None:
+            self._simulation = simulate_sea_state_ensemble(
+                self.spec, self.sea_state, self.rope, **self.simulation_options
+            )
+        return self._simulation
+
+    def calculate_dynamic_load_factor(self) -> float:
+        """
+        설계 동하중 계수 계산
+
+        Returns:
+            float: 설계 백분위 최대 토크 / 정하중 토크
+        """
+        simulation = self.simulation
+        return simulation.peak_torque_percentile(self.design_percentile) / simulation.static_torque_nm
+
+    def apply_environmental_corrections(self, base_torque: float) -> Tuple[float, Dict[str, float]]:
+        """
+        환경 보정 계수 적용 (진동 보정 → 시뮬레이션 동하중 계수)
+
+        Args:
+            base_torque: 기본 토크
+
+        Returns:
+            Tuple[float, Dict[str, float]]: (보정된 토크, 보정 계수 딕셔너리)
+        """
+        # 대표 해상 상태가 없는 환경(연안/북극해/열대해)은 고정 진동 보정 사용
+        if self.sea_state is None and self.spec.environment not in SEA_STATES:
+            return super().apply_environmental_corrections(base_torque)
+
+        corrections = self.ENVIRONMENTAL_CORRECTIONS[self.spec.environment]
+        dynamic_factor = self.calculate_dynamic_load_factor()
+        total = corrections["salt"] * corrections["temp"] * dynamic_factor
+
+        correction_summary = {
+            "염분_보정": corrections["salt"],
+            "온도_보정": corrections["temp"],
+            "동하중_보정": dynamic_factor,
+            "총_보정": total
+        }
+
+        logger.info(f"환경 보정 적용 (시뮬레이션): {total:.3f}배 증가")
+        return base_torque * total, correction_summary
+
+
+def main():
+    """메인 실행 함수 - 근해 윈치 동하중 예제"""
+
+    print("🌊 근해 윈치 파랑 앙상블 시뮬레이션 예제\n")
+
+    offshore_winch = MotorSpecification(
+        load_capacity_ton=50.0, operating_speed_rpm=1800, drum_radius_m=1.2,
+        system_efficiency=0.85, safety_factor=1.2, load_inertia_kgm2=4250,
+        motor_inertia_kgm2=125, environment=MarineEnvironment.OFFSHORE,
+        classification=ClassificationSociety.DNV
+    )
+
+    calculator = SeaStateMotorCalculator(offshore_winch, n_realizations=256, seed=0)
+    result = calculator.perform_comprehensive_calculation()
+    print(generate_detailed_report(offshore_winch, result))
+
+    simulation = calculator.simulation
+    print("📈 드럼 토크 분포:")
+    print(f"   정하중 토크: {simulation.static_torque_nm:,.0f} N·m")
+    for q in (50, 95, 99):
+        print(f"   최대 토크 P{q}: {simulation.peak_torque_percentile(q):,.0f} N·m")
+    print(f"   RMS 토크 평균: {simulation.rms_torque_nm.mean():,.0f} N·m")
+    print(f"   로프 처짐 발생 실현: {np.mean(simulation.slack_ratio > 0):.1%}")
+
+    print("\n⚖️ 고정 진동 계수 대비:")
+    fixed = MarineMotorCalculator(offshore_winch).perform_comprehensive_calculation()
+    print(f"   고정 계수: {fixed.required_torque_nm:,.0f} N·m, {fixed.motor_power_kw:.1f} kW")
+    print(f"   시뮬레이션: {result.required_torque_nm:,.0f} N·m, {result.motor_power_kw:.1f} kW")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+모터 계산 단계 의존성 그래프 (증분 재계산)
+
+perform_comprehensive_calculation 의 각 단계를 지연 평가 노드로 나누어,
+사양 필드를 수정하면 영향을 받는 노드만 다시 계산합니다.
+
+주요 기능:
+- 단계별 입력 의존성 선언 (사양 필드 / 상위 단계)
+- 필드 수정 시 하위 노드만 무효화
+- 단계별 캐시 값 및 계산 횟수 조회
+
+Author: Marine Engineering Team
+Date: 2025.08.22
+"""
+
+import math
+import logging
+import numpy as np
+from dataclasses import fields, replace
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from claude_code2 import (
+    CalculationResult,
+    ClassificationSociety,
+    MarineEnvironment,
+    MarineMotorCalculator,
+    MotorSpecification,
+)
+
+logger = logging.getLogger(__name__)
+
+SPEC_FIELDS = tuple(f.name for f in fields(MotorSpecification))
+SERIES_INPUTS = ("time_series", "torque_series")
+
+
+def _basic_torque(calc: MarineMotorCalculator, v: Dict) -> float:
+    load_force_n = v["load_capacity_ton"] * 1000 * calc.GRAVITY_ACCELERATION
+    return calc.calculate_basic_torque(load_force_n)
+
+
+def _required_torque(calc: MarineMotorCalculator, v: Dict) -> float:
+    env_corrected_torque, _ = v["environmental_correction"]
+    return env_corrected_torque * v["classification_safety"] * v["safety_factor"]
+
+
+def _rms_torque(calc: MarineMotorCalculator, v: Dict) -> Optional[float]:
+    if v["time_series"] is None or v["torque_series"] is None:
+        return None
+    return calc.calculate_rms_torque(v["time_series"], v["torque_series"])
+
+
+def _result(calc: MarineMotorCalculator, v: Dict) -> CalculationResult:
+    return CalculationResult(
+        required_torque_nm=v["required_torque"],
+        motor_power_kw=v["motor_power"],
+        optimal_gear_ratio=v["optimal_gear_ratio"],
+        minimum_gear_ratio=v["minimum_gear_ratio"],
+        rms_torque_nm=v["rms_torque"],
+        environmental_corrections=v["environmental_correction"][1]
+    )
+
+
+# 단계 이름 → (입력 목록, 계산 함수)
+# 계산 함수는 선언된 입력만 읽어야 무효화가 정확합니다.
+STAGES: Dict[str, Tuple[Tuple[str, ...], Callable[[MarineMotorCalculator, Dict], object]]] = {
+    "basic_torque": (
+        ("load_capacity_ton", "drum_radius_m", "system_efficiency"),
+        _basic_torque,
+    ),
+    "environmental_correction": (
+        ("environment", "basic_torque"),
+        lambda calc, v: calc.apply_environmental_corrections(v["basic_torque"]),
+    ),
+    "classification_safety": (
+        ("classification",),
+        lambda calc, v: calc.get_classification_safety_factor(),
+    ),
+    "required_torque": (
+        ("environmental_correction", "classification_safety", "safety_factor"),
+        _required_torque,
+    ),
+    "motor_power": (
+        ("required_torque", "operating_speed_rpm"),
+        lambda calc, v: calc.calculate_power_requirement(v["required_torque"]),
+    ),
+    "optimal_gear_ratio": (
+        ("load_inertia_kgm2", "motor_inertia_kgm2"),
+        lambda calc, v: calc.calculate_optimal_gear_ratio(),
+    ),
+    "minimum_gear_ratio": (
+        ("optimal_gear_ratio",),
+        lambda calc, v: v["optimal_gear_ratio"] / math.sqrt(10),
+    ),
+    "rms_torque": (
+        SERIES_INPUTS,
+        _rms_torque,
+    ),
+    "result": (
+        ("required_torque", "motor_power", "optimal_gear_ratio",
+         "minimum_gear_ratio", "rms_torque", "environmental_correction"),
+        _result,
+    ),
+}
+
+
+class SizingGraph:
+    """지연 평가 모터 계산 그래프"""
+
+    def __init__(self, specification: MotorSpecification,
+                 time_series: Optional[np.ndarray] = None,
+                 torque_series: Optional[np.ndarray] = None):
+        """
+        초기화 메서드
+
+        Args:
+            specification: 모터 사양 객체
+            time_series: 시간 배열 (선택적)
+            torque_series: 토크 배열 (선택적)
+        """
+        self._calculator = MarineMotorCalculator(specification)
+        self._series = {"time_series": time_series, "torque_series": torque_series}
+        self._cache: Dict[str, object] = {}
+        self.compute_counts: Dict[str, int] = {name: 0 for name in STAGES}
+
+        # 입력/단계 → 직접 의존하는 단계
+        self._dependents: Dict[str, List[str]] = {}
+        for name, (inputs, _) in STAGES.items():
+            for source in inputs:
+                self._dependents.setdefault(source, []).append(name)
+
+    @property
+    def spec(self) -> MotorSpecification:
+        """현재 모터 사양"""
+        return self._calculator.spec
+
+    def _input_value(self, name: str):
+        if name in SERIES_INPUTS:
+            return self._series[name]
+        return getattr(self.spec, name)
+
+    def get(self, name: str):
+        """
+        단계 값 조회 (캐시가 없으면 상위 단계부터 계산)
+
+        Args:
+            name: 단계 이름 또는 입력 이름
+
+        Returns:
+            단계 계산 값
+        """
+        if name not in STAGES:
+            return self._input_value(name)
+        if name not in self._cache:
+            inputs, func = STAGES[name]
+            values = {source: self.get(source) for source in inputs}
+            self._cache[name] = func(self._calculator, values)
+            self.compute_counts[name] += 1
+            logger.debug(f"단계 계산: {name}")
+        return self._cache[name]
+
+    def result(self) -> CalculationResult:
+        """종합 계산 결과 (perform_comprehensive_calculation 과 동일)"""
+        return self.get("result")
+
+    def cached_stages(self) -> Dict[str, object]:
+        """현재 캐시된 단계 값"""
+        return dict(self._cache)
+
+    def is_cached(self, name: str) -> bool:
+        """단계 캐시 여부"""
+        return name in self._cache
+
+    def _invalidate(self, changed: Set[str]) -> Set[str]:
+        """변경된 입력의 모든 하위 단계 캐시 제거"""
+        invalidated: Set[str] = set()
+        stack = list(changed)
+        while stack:
+            for stage in self._dependents.get(stack.pop(), []):
+                if stage not in invalidated:
+                    invalidated.add(stage)
+                    stack.append(stage)
+        for stage in invalidated:
+            self._cache.pop(stage, None)
+        logger.debug(f"무효화된 단계: {sorted(invalidated)}")
+        return invalidated
+
+    def update(self, **changes) -> Set[str]:
+        """
+        사양 필드 / 시계열 수정
+
+        Args:
+            **changes: 필드 이름 → 새 값
+
+        Returns:
+            Set[str]: 무효화된 단계 이름
+        """
+        unknown = set(changes) - set(SPEC_FIELDS) - set(SERIES_INPUTS)
+        if unknown:
+            raise ValueError(f"알 수 없는 입력입니다: {sorted(unknown)}")
+
+        spec_changes = {k: v for k, v in changes.items() if k in SPEC_FIELDS}
+        if spec_changes:
+            previous = self._calculator.spec
+            self._calculator.spec = replace(previous, **spec_changes)
+            try:
+                self._calculator._validate_inputs()
+            except ValueError:
+                self._calculator.spec = previous
+                raise
+        for name in SERIES_INPUTS:
+            if name in changes:
+                self._series[name] = changes[name]
+
+        return self._invalidate(set(changes))
+
+
+def main():
+    """메인 실행 함수 - what-if 편집 예제"""
+
+    winch = MotorSpecification(
+        load_capacity_ton=50.0, operating_speed_rpm=1800, drum_radius_m=1.2,
+        system_efficiency=0.85, safety_factor=1.2, load_inertia_kgm2=4250,
+        motor_inertia_kgm2=125, environment=MarineEnvironment.OFFSHORE,
+        classification=ClassificationSociety.DNV
+    )
+    graph = SizingGraph(winch)
+    base = graph.result()
+    print(f"기준: {base.required_torque_nm:,.0f} N·m, {base.motor_power_kw:,.1f} kW, 감속비 {base.optimal_gear_ratio:.1f}:1")
+
+    for env in (MarineEnvironment.COASTAL, MarineEnvironment.ARCTIC):
+        invalidated = graph.update(environment=env)
+        result = graph.result()
+        print(f"{env.value}: {result.required_torque_nm:,.0f} N·m, {result.motor_power_kw:,.1f} kW "
+              f"(재계산: {', '.join(sorted(invalidated))})")
+
+    invalidated = graph.update(load_inertia_kgm2=6000)
+    result = graph.result()
+    print(f"부하 관성 6000: 감속비 {result.optimal_gear_ratio:.1f}:1 (재계산: {', '.join(sorted(invalidated))})")
+    print(f"단계별 계산 횟수: {graph.compute_counts}")
+
+
+if __name__ == "__main__":
+    main()